@@ -2,7 +2,9 @@
 
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional
+from operator import itemgetter
+from typing import Dict, Any, Iterable, List, Optional, Sequence, Union
+import orjson
 from pydantic import BaseModel, Field
 
 # Local imports
@@ -14,7 +16,10 @@ from models import (
     LifeEventObject,
     BusinessObject
 )
-from utils import save_output_to_markdown, merge_content_creator_info, ensure_dict
+from utils import save_output_to_markdown, merge_content_creator_info, ensure_dict, current_year
+
+# Creator fields read by analyze_creator; the rest is skipped when dumping models
+_ANALYSIS_FIELDS = {"values", "challenges", "achievements", "life_events", "businesses"}
 
 class AgentConfig(BaseModel):
     """
@@ -49,65 +54,102 @@ class ContentAnalysisAgent:
         """Update agent's last activity timestamp"""
         self.last_active = datetime.now()
 
-    def analyze_creator(self, creator_data: Dict[str, Any]) -> Dict[str, Any]:
+    def analyze_creator(self, creator_data: Union[ContentCreatorInfo, Dict[str, Any]]) -> Dict[str, Any]:
         """
         Perform comprehensive analysis of content creator data
         
         Args:
-            creator_data: Raw creator data from multiple sources
+            creator_data: Raw creator data from multiple sources, or an
+                already-validated ContentCreatorInfo
             
         Returns:
             Dictionary containing structured analysis results
         """
         self.update_activity()
         
-        # Convert to dict if Pydantic model
-        data = ensure_dict(creator_data)
+        # Convert to dict if Pydantic model, dumping only the analyzed fields
+        data = ensure_dict(creator_data, include=_ANALYSIS_FIELDS)
         
-        # Perform analysis
-        analysis = {
-            "basic_stats": self._calculate_basic_stats(data),
-            "business_analysis": self._analyze_business(data),
-            "values_assessment": self._assess_values(data),
-            "timeline_analysis": self._analyze_timelines(data)
-        }
+        # Unpack each section once; missing or None sections count as empty
+        analysis = self._compute_all(
+            values=data.get("values") or (),
+            challenges=data.get("challenges") or (),
+            achievements=data.get("achievements") or (),
+            life_events=data.get("life_events") or (),
+            businesses=data.get("businesses") or (),
+            this_year=current_year()
+        )
         
         self.analysis_history.append(analysis)
         return analysis
 
-    def _calculate_basic_stats(self, data: Dict) -> Dict:
-        """Calculate basic statistics from creator data"""
-        return {
-            "total_life_events": len(data.get("life_events", [])),
-            "total_challenges": len(data.get("challenges", [])),
-            "total_achievements": len(data.get("achievements", [])),
-            "business_count": len(data.get("businesses", []))
-        }
-
-    def _analyze_business(self, data: Dict) -> Dict:
-        """Analyze business ventures and financial aspects"""
-        businesses = data.get("businesses", [])
-        return {
-            "total_businesses": len(businesses),
-            "active_businesses": sum(1 for b in businesses if b.get("is_active", False)),
-            "average_revenue": sum(b.get("revenue", 0) for b in businesses) / len(businesses) if businesses else 0
-        }
-
-    def _assess_values(self, data: Dict) -> Dict:
-        """Evaluate and score creator's core values"""
-        values = data.get("values", [])
-        return {
-            "core_values": [v["name"] for v in values],
-            "value_consistency_score": len(values) / 10  # Simplified scoring
-        }
+    def analyze_many(self, creators: Iterable[Union[ContentCreatorInfo, Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Analyze a batch of content creators
+        
+        Produces the same results as calling analyze_creator on each
+        creator, but the per-call overhead (activity timestamp and
+        current-year lookup) is paid once for the whole batch.
+        
+        Args:
+            creators: Raw creator data dictionaries or ContentCreatorInfo models
+            
+        Returns:
+            List of analysis dictionaries, in input order
+        """
+        self.update_activity()
+        
+        this_year = current_year()
+        compute = self._compute_all
+        analyses = []
+        for creator in creators:
+            data = ensure_dict(creator, include=_ANALYSIS_FIELDS)
+            analyses.append(compute(
+                values=data.get("values") or (),
+                challenges=data.get("challenges") or (),
+                achievements=data.get("achievements") or (),
+                life_events=data.get("life_events") or (),
+                businesses=data.get("businesses") or (),
+                this_year=this_year
+            ))
+        
+        self.analysis_history.extend(analyses)
+        return analyses
 
-    def _analyze_timelines(self, data: Dict) -> Dict:
-        """Analyze temporal patterns in creator's career"""
-        events = sorted(data.get("life_events", []), 
-                       key=lambda x: x.get("year", 0))
+    def _compute_all(self, values: Sequence[Dict], challenges: Sequence[Dict],
+                     achievements: Sequence[Dict], life_events: Sequence[Dict],
+                     businesses: Sequence[Dict], this_year: int) -> Dict:
+        """Compute every analysis section with a single pass over each list"""
+        active_businesses = 0
+        total_revenue = 0.0
+        for b in businesses:
+            if b.get("is_active", False):
+                active_businesses += 1
+            total_revenue += b.get("revenue") or 0.0
+        
+        career_start = min(map(itemgetter("year"), life_events), default=None)
+        
         return {
-            "career_start": events[0]["year"] if events else None,
-            "milestone_frequency": len(events) / (datetime.now().year - events[0]["year"]) if events else 0
+            "basic_stats": {
+                "total_life_events": len(life_events),
+                "total_challenges": len(challenges),
+                "total_achievements": len(achievements),
+                "business_count": len(businesses)
+            },
+            "business_analysis": {
+                "total_businesses": len(businesses),
+                "active_businesses": active_businesses,
+                "average_revenue": total_revenue / len(businesses) if businesses else 0
+            },
+            "values_assessment": {
+                "core_values": [v["name"] for v in values],
+                "value_consistency_score": len(values) / 10  # Simplified scoring
+            },
+            "timeline_analysis": {
+                "career_start": career_start,
+                # A career that started this year counts as one year
+                "milestone_frequency": len(life_events) / max(this_year - career_start, 1) if life_events else 0
+            }
         }
 
     def generate_report(self, analysis: Dict, format: str = "markdown") -> str:
@@ -128,8 +170,8 @@ class ContentAnalysisAgent:
         if format == "markdown":
             save_output_to_markdown(analysis, filename)
         elif format == "json":
-            with open(filename, "w") as f:
-                json.dump(analysis, f)
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(analysis))
         else:
             raise ValueError("Unsupported format. Use 'markdown' or 'json'")
             
@@ -147,11 +189,7 @@ class ContentAnalysisAgent:
         """
         self.update_activity()
         
-        merged = {}
-        for source in sources:
-            merged = merge_content_creator_info(merged, ensure_dict(source))
-            
-        return merged
+        return merge_content_creator_info(*(ensure_dict(source) for source in sources))
 
 if __name__ == "__main__":
     # Example usage
@@ -1,26 +1,35 @@
 # app.py
 
+import pandas as pd
 import streamlit as st
-from datetime import datetime
-from models import (
-    ContentCreatorInfo,
-    ValueObject,
-    ChallengeObject,
-    AchievementObject,
-    LifeEventObject,
-    BusinessObject
-)
+from models import ContentCreatorInfo
 from agent import ContentAnalysisAgent, AgentConfig
-from utils import save_output_to_markdown
-import json
+from utils import render_markdown, current_year
+import orjson
 
-# Initialize the AI Agent
-def initialize_agent():
-    config = AgentConfig(
+# Agent configuration, validated once and shared read-only by all sessions
+@st.cache_resource
+def load_agent_config():
+    return AgentConfig(
         name="CreatorAnalyst v1.0",
         role="Comprehensive YouTube Creator Analysis System"
     )
-    return ContentAnalysisAgent(config)
+
+# Initialize the AI Agent (one per session, so analysis history and
+# activity tracking are never shared between users)
+def initialize_agent():
+    if 'agent' not in st.session_state:
+        st.session_state.agent = ContentAnalysisAgent(load_agent_config())
+    return st.session_state.agent
+
+# Render the Markdown report text once per distinct analysis; the cache is
+# shared by all sessions, so keep it bounded
+@st.cache_data(
+    max_entries=64,
+    hash_funcs={dict: lambda d: orjson.dumps(d, option=orjson.OPT_SORT_KEYS)}
+)
+def cached_report(analysis):
+    return render_markdown(analysis)
 
 # Main application
 def main():
@@ -31,12 +40,10 @@ def main():
     )
 
     # Initialize session state
-    if 'creator_data' not in st.session_state:
-        st.session_state.creator_data = {}
     if 'analysis' not in st.session_state:
         st.session_state.analysis = {}
 
-    # Initialize agent
+    # Initialize agent (kept in session state across reruns)
     agent = initialize_agent()
 
     # Header Section
@@ -58,13 +65,13 @@ def main():
                 "Primary Content Niche*",
                 ["Tech", "Lifestyle", "Education", "Entertainment", "Gaming", "Other"]
             )
-            start_year = st.number_input("Channel Start Year*", 2005, datetime.now().year)
+            start_year = st.number_input("Channel Start Year*", 2005, current_year())
 
         with col2:
             st.subheader("Demographic Info")
             country = st.text_input("Country", "Unknown")
             age = st.number_input("Age", 18, 100)
-            team_size = st.number_input("Team Size", 0, 100, 0)
+            team_size = st.number_input("Team Size", 1, 100, 1)
             monthly_views = st.number_input("Avg Monthly Views (millions)", 0.0, 100.0, 0.0)
 
         # Dynamic Lists
@@ -73,20 +80,18 @@ def main():
 
         with tab1:
             st.markdown("**Core Values**")
-            if 'values_count' not in st.session_state:
-                st.session_state.values_count = 1
-            for i in range(st.session_state.values_count):
-                with st.container():
-                    col_a, col_b = st.columns(2)
-                    with col_a:
-                        st.text_input(f"Value {i+1} Name*", key=f"value_name_{i}")
-                    with col_b:
-                        st.text_area(f"Value {i+1} Description", key=f"value_desc_{i}")
-
-            # استخدام st.form_submit_button بدلاً من st.button
-            if st.form_submit_button("➕ Add Value"):
-                st.session_state.values_count += 1
-
+            # One editable table instead of a widget pair per value
+            values_df = st.data_editor(
+                pd.DataFrame(columns=["name", "impact_today", "description"], dtype=str),
+                num_rows="dynamic",
+                column_config={
+                    "name": st.column_config.TextColumn("Value Name*"),
+                    "impact_today": st.column_config.TextColumn("Impact Today*"),
+                    "description": st.column_config.TextColumn("Value Description")
+                },
+                use_container_width=True,
+                key="values_df"
+            )
 
         # Similar tabs for Challenges, Achievements, Life Events, and Businesses
         # (Implementation pattern similar to Values tab)
@@ -101,7 +106,16 @@ def main():
                     return
 
                 # Process form data
-                process_creator_data(agent)
+                personal_info = {
+                    "full_name": creator_name,
+                    "channel_name": creator_name,
+                    "channel_url": channel_url,
+                    "niche": niche,
+                    "start_year": start_year,
+                    "country": country,
+                    "team_size": team_size
+                }
+                process_creator_data(agent, personal_info, values_df)
                 st.success("Analysis completed successfully!")
                 
             except Exception as e:
@@ -112,64 +126,50 @@ def main():
         st.divider()
         st.subheader("Analysis Results")
         
-        # Generate report
-        report_path = agent.generate_report(st.session_state.analysis)
+        # Generate report text (reused while the analysis is unchanged)
+        report_text = cached_report(st.session_state.analysis)
         
         col_left, col_right = st.columns(2)
         with col_left:
             st.download_button(
                 label="Download Full Report",
-                data=json.dumps(st.session_state.analysis, indent=2),
+                data=orjson.dumps(st.session_state.analysis, option=orjson.OPT_INDENT_2),
                 file_name=f"{creator_name}_analysis.json",
                 mime="application/json"
             )
             
         with col_right:
-            with open(report_path, "r") as f:
-                st.download_button(
-                    label="Download Markdown Report",
-                    data=f,
-                    file_name=f"{creator_name}_analysis.md",
-                    mime="text/markdown"
-                )
+            st.download_button(
+                label="Download Markdown Report",
+                data=report_text,
+                file_name=f"{creator_name}_analysis.md",
+                mime="text/markdown"
+            )
 
         # Show analysis preview
         with st.expander("Preview Analysis Summary"):
             st.json(st.session_state.analysis)
 
-def process_creator_data(agent):
-    """Process form data and run analysis"""
-    # Collect values
-    values = []
-    for i in range(st.session_state.values_count):
-        values.append(ValueObject(
-            name=st.session_state[f"value_name_{i}"],
-            description=st.session_state.get(f"value_desc_{i}", "")
-        ))
+def process_creator_data(agent, personal_info: dict, values_df: pd.DataFrame):
+    """Process form data, validate it once and run analysis"""
+    # Collect non-empty value rows
+    values_df = values_df[values_df["name"].fillna("").str.strip() != ""]
+    values = values_df.astype(object).where(values_df.notna(), None).to_dict("records")
 
     # Collect other sections similarly (challenges, achievements, etc.)
     
-    # Build ContentCreatorInfo object
-    creator_info = ContentCreatorInfo(
-        personal_info={
-            "name": st.session_state.creator_name,
-            "channel_url": st.session_state.channel_url,
-            "niche": st.session_state.niche,
-            "start_year": st.session_state.start_year,
-            "country": st.session_state.country,
-            "age": st.session_state.age,
-            "team_size": st.session_state.team_size,
-            "monthly_views": st.session_state.monthly_views
-        },
-        values=values,
-        challenges=[],  # Add collected challenges
-        achievements=[],  # Add collected achievements
-        life_events=[],  # Add collected life events
-        businesses=[]  # Add collected businesses
-    )
-
-    # Run analysis
-    analysis = agent.analyze_creator(creator_info.dict())
+    # Validate the whole payload in a single pass on submit
+    creator_info = ContentCreatorInfo.model_validate({
+        "personal_info": personal_info,
+        "values": values,
+        "challenges": [],  # Add collected challenges
+        "achievements": [],  # Add collected achievements
+        "life_events": [],  # Add collected life events
+        "businesses": []  # Add collected businesses
+    })
+
+    # Run analysis on the validated model; the agent dumps only the fields it reads
+    analysis = agent.analyze_creator(creator_info)
     st.session_state.analysis = analysis
 
 if __name__ == "__main__":
@@ -1,9 +1,20 @@
 # models.py
 
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Dict, Any
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+from typing import Annotated, List, Literal, Optional, Dict, Any
 from datetime import datetime
 
+from utils import current_year
+
+def _validate_past_year(value: int) -> int:
+    """Reject years later than the current one"""
+    if value > current_year():
+        raise ValueError("Year cannot be in the future")
+    return value
+
+# Year that is checked against the current year at validation time
+PastYear = Annotated[int, AfterValidator(_validate_past_year)]
+
 class ValueObject(BaseModel):
     """
     Represents a core value of a content creator
@@ -14,6 +25,8 @@ class ValueObject(BaseModel):
         impact_today: How this value influences current work
         description: Detailed explanation of the value
     """
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., min_length=2, max_length=50)
     origin: str = Field("Personal belief", description="Source of this value")
     impact_today: str = Field(..., description="Current impact on content creation")
@@ -29,8 +42,10 @@ class ChallengeObject(BaseModel):
         learnings: Key takeaways from overcoming the challenge
         duration: How long the challenge lasted (months)
     """
+    model_config = ConfigDict(frozen=True)
+
     description: str = Field(..., min_length=10, max_length=200)
-    year: int = Field(..., ge=2005, le=datetime.now().year)
+    year: PastYear = Field(..., ge=2005)
     learnings: str = Field(..., min_length=10, max_length=500)
     duration: Optional[int] = Field(None, ge=1, le=120)
 
@@ -44,8 +59,10 @@ class AchievementObject(BaseModel):
         impact: How this achievement affected their career
         metrics: Quantitative measures of success
     """
+    model_config = ConfigDict(frozen=True)
+
     description: str = Field(..., min_length=10, max_length=200)
-    year: int = Field(..., ge=2005, le=datetime.now().year)
+    year: PastYear = Field(..., ge=2005)
     impact: str = Field(..., min_length=10, max_length=500)
     metrics: Dict[str, float] = Field(
         default_factory=dict,
@@ -62,11 +79,13 @@ class LifeEventObject(BaseModel):
         description: Detailed description of the event
         impact: How it influenced their content creation
     """
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., min_length=2, max_length=100)
-    year: int = Field(..., ge=1900, le=datetime.now().year)
+    year: PastYear = Field(..., ge=1900)
     description: str = Field(..., min_length=10, max_length=500)
     impact: str = Field(..., min_length=10, max_length=500)
-    category: Optional[str] = Field(None, pattern="^(personal|professional|financial)$")
+    category: Optional[Literal["personal", "professional", "financial"]] = None
 
 class BusinessObject(BaseModel):
     """
@@ -80,21 +99,14 @@ class BusinessObject(BaseModel):
         business_type: Type of business
         status: Current operational status
     """
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., min_length=2, max_length=100)
     description: str = Field(..., min_length=10, max_length=500)
-    year_started: int = Field(..., ge=2005, le=datetime.now().year)
+    year_started: PastYear = Field(..., ge=2005)
     annual_revenue: Optional[float] = Field(None, ge=0)
-    business_type: str = Field(
-        ...,
-        pattern="^(merchandise|courses|sponsorships|production|other)$"
-    )
-    status: str = Field("active", pattern="^(active|inactive|sold|acquired)$")
-
-    @field_validator('year_started')
-    def validate_year_started(cls, value):
-        if value > datetime.now().year:
-            raise ValueError("Business cannot start in the future")
-        return value
+    business_type: Literal["merchandise", "courses", "sponsorships", "production", "other"]
+    status: Literal["active", "inactive", "sold", "acquired"] = "active"
 
 class PersonalInfo(BaseModel):
     """
@@ -109,11 +121,13 @@ class PersonalInfo(BaseModel):
         country: Base country
         team_size: Number of people in production team
     """
+    model_config = ConfigDict(frozen=True)
+
     full_name: str = Field(..., min_length=2, max_length=100)
     channel_name: str = Field(..., min_length=2, max_length=100)
     channel_url: str = Field(..., pattern=r"^(https?\:\/\/)?(www\.)?(youtube\.com|youtu\.?be)\/.+")
     niche: str = Field(..., min_length=2, max_length=50)
-    start_year: int = Field(..., ge=2005, le=datetime.now().year)
+    start_year: PastYear = Field(..., ge=2005)
     country: Optional[str] = Field(None, min_length=2, max_length=56)
     team_size: int = Field(1, ge=1, le=1000)
 
@@ -144,8 +158,11 @@ class ContentCreatorInfo(BaseModel):
         }
     )
 
-    class Config:
-        schema_extra = {
+    # Frozen blocks field reassignment only; the list and dict fields stay
+    # unhashable, so these instances cannot be used as dict keys or in sets
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "personal_info": {
                     "full_name": "John Creator",
@@ -164,3 +181,4 @@ class ContentCreatorInfo(BaseModel):
                 }]
             }
         }
+    )
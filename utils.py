@@ -1,12 +1,72 @@
 # utils.py
 
+import io
 import os
 import json
 import re
+import time
 from datetime import datetime
-from typing import Dict, Any, Union
+from functools import lru_cache, singledispatch
+from typing import Dict, Any, Optional, Set, TextIO, Union
 from pydantic import BaseModel
 
+# Markdown heading prefixes indexed by level
+_HASHES = ["", "#", "##", "###", "####", "#####", "######"]
+
+@lru_cache(maxsize=256)
+def _section_title(key: str) -> str:
+    """Markdown heading text for a section key (bounded memo)"""
+    return key.replace("_", " ").title()
+
+@lru_cache(maxsize=256)
+def _field_label(key: str) -> str:
+    """Bold label text for a scalar field key (bounded memo)"""
+    return key.title()
+
+def write_markdown(data: Dict[str, Any], stream: TextIO) -> None:
+    """
+    Write analysis results as Markdown to a text stream
+    
+    The nested data is walked with an explicit stack of (key, value, level)
+    nodes; list items that aren't dicts are pushed with key=None as bullets.
+    
+    Args:
+        data: Dictionary containing analysis results
+        stream: Writable text stream (open file, io.StringIO, ...)
+    """
+    stream.write("# Content Creator Analysis Report\n")
+    stack = [(section, details, 2) for section, details in reversed(data.items())]
+    while stack:
+        key, value, level = stack.pop()
+        if key is None:
+            stream.write(f"- {value}\n")
+        elif isinstance(value, (dict, list)):
+            header = _HASHES[level] if level < len(_HASHES) else "#" * level
+            stream.write(f"\n{header} {_section_title(key)}\n")
+            if isinstance(value, dict):
+                stack.extend((k, v, level + 1) for k, v in reversed(value.items()))
+            else:
+                stack.extend(
+                    ("", item, level + 1) if isinstance(item, dict) else (None, item, level)
+                    for item in reversed(value)
+                )
+        else:
+            stream.write(f"**{_field_label(key)}:** {value}\n\n")
+
+def render_markdown(data: Dict[str, Any]) -> str:
+    """
+    Render analysis results as a Markdown string
+    
+    Args:
+        data: Dictionary containing analysis results
+        
+    Returns:
+        Markdown report text
+    """
+    buffer = io.StringIO()
+    write_markdown(data, buffer)
+    return buffer.getvalue()
+
 def save_output_to_markdown(data: Dict[str, Any], filename: str = None) -> str:
     """
     Save analysis results to a Markdown file with proper formatting
@@ -30,49 +90,57 @@ def save_output_to_markdown(data: Dict[str, Any], filename: str = None) -> str:
             filename = f"reports/creator_report_{timestamp}.md"
 
         # Create directory structure if needed
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-
-        # Generate Markdown content
-        content = ["# Content Creator Analysis Report\n"]
-        
-        def process_section(key: str, value: Any, level: int = 2):
-            """Recursive function to process nested data"""
-            nonlocal content
-            header = "#" * level
-            if isinstance(value, dict):
-                content.append(f"\n{header} {key.title().replace('_', ' ')}\n")
-                for k, v in value.items():
-                    process_section(k, v, level + 1)
-            elif isinstance(value, list):
-                content.append(f"\n{header} {key.title().replace('_', ' ')}\n")
-                for item in value:
-                    if isinstance(item, dict):
-                        process_section("", item, level + 1)
-                    else:
-                        content.append(f"- {str(item)}\n")
-            else:
-                content.append(f"**{key.title()}:** {value}\n\n")
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
 
-        for section, details in data.items():
-            process_section(section, details)
-
-        # Write to file
+        # Stream Markdown content straight to the file
         with open(filename, "w", encoding="utf-8") as f:
-            f.writelines(content)
+            write_markdown(data, f)
 
         return os.path.abspath(filename)
 
     except Exception as e:
         raise RuntimeError(f"Failed to save Markdown: {str(e)}") from e
 
-def merge_content_creator_info(source1: Dict[str, Any], 
-                              source2: Dict[str, Any]) -> Dict[str, Any]:
+# Top-level list sections of ContentCreatorInfo, merged by concatenation
+_LIST_SECTIONS = ("values", "challenges", "achievements", "life_events", "businesses")
+
+def _deep_merge(base: Any, update: Any) -> Any:
+    """Generic recursive merge used for keys outside the known schema"""
+    if isinstance(base, dict) and isinstance(update, dict):
+        merged = dict(base)
+        for key, val in update.items():
+            merged[key] = _deep_merge(merged[key], val) if key in merged else val
+        return merged
+    if isinstance(base, list) and isinstance(update, list):
+        return base + update
+    return update
+
+def _merge_known(merged: Dict[str, Any], source: Dict[str, Any]) -> None:
+    """Merge one source into ``merged`` in place, specialized for the creator schema"""
+    # None sections count as empty, matching analyze_creator
+    for key in _LIST_SECTIONS:
+        if key in source:
+            merged.setdefault(key, []).extend(source.get(key) or ())
+    if "personal_info" in source:
+        merged.setdefault("personal_info", {}).update(source.get("personal_info") or {})
+    for key, val in source.items():
+        if key in _LIST_SECTIONS or key == "personal_info":
+            continue
+        merged[key] = _deep_merge(merged[key], val) if key in merged else val
+
+def merge_content_creator_info(*sources: Dict[str, Any]) -> Dict[str, Any]:
     """
-    Deep merge two content creator information dictionaries
+    Merge content creator information dictionaries
+    
+    List sections are concatenated (None counts as empty) and
+    personal_info is merged shallowly with dict.update, which is enough
+    for the flat PersonalInfo schema; any other keys fall back to a
+    recursive merge. The sources are not modified.
     
     Args:
-        source1: Primary data source
-        source2: Secondary data source
+        sources: Data sources in priority order (later ones win on conflicts)
         
     Returns:
         Merged dictionary with combined information
@@ -83,28 +151,23 @@ def merge_content_creator_info(source1: Dict[str, Any],
             {"values": [{"name": "Quality"}], "challenges": [...]}
         )
     """
-    merged = source1.copy()
-    
-    def recursive_merge(base: Any, update: Any):
-        if isinstance(base, dict) and isinstance(update, dict):
-            for key, val in update.items():
-                if key in base:
-                    base[key] = recursive_merge(base[key], val)
-                else:
-                    base[key] = val
-            return base
-        if isinstance(base, list) and isinstance(update, list):
-            return base + update
-        return update
-    
-    return recursive_merge(merged, source2)
+    merged: Dict[str, Any] = {}
+    for source in sources:
+        _merge_known(merged, source)
+    return merged
 
-def ensure_dict(data: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
+@singledispatch
+def ensure_dict(data: Union[BaseModel, Dict[str, Any]],
+                include: Optional[Set[str]] = None) -> Dict[str, Any]:
     """
     Convert Pydantic models to dictionaries while handling raw dicts
     
+    Dispatches on the input type; dicts are returned unchanged and
+    Pydantic models are dumped with model_dump().
+    
     Args:
         data: Input data (either Pydantic model or dictionary)
+        include: Top-level fields to keep when dumping a model (optional)
         
     Returns:
         Dictionary representation of the input
@@ -113,12 +176,27 @@ def ensure_dict(data: Union[BaseModel, Dict[str, Any]]) -> Dict[str, Any]:
         >>> ensure_dict(ContentCreatorInfo(...))
         {personal_info: {...}, ...}
     """
-    if isinstance(data, BaseModel):
-        return data.dict()
-    if isinstance(data, dict):
-        return data
     raise ValueError("Input must be Pydantic model or dictionary")
 
+@ensure_dict.register(dict)
+def _ensure_dict_from_dict(data: Dict[str, Any],
+                           include: Optional[Set[str]] = None) -> Dict[str, Any]:
+    return data
+
+@ensure_dict.register(BaseModel)
+def _ensure_dict_from_model(data: BaseModel,
+                            include: Optional[Set[str]] = None) -> Dict[str, Any]:
+    return data.model_dump(mode="python", include=include, warnings=False)
+
+# Channel and short-link URL formats accepted by validate_youtube_url.
+# The scheme is stripped and the host checked with a cheap prefix test
+# before the regex runs on the remainder.
+_YOUTUBE_SCHEMES = ("https://", "http://")
+_YOUTUBE_HOSTS = ("youtube.com/", "youtu.be/", "www.youtube.com/", "www.youtu.be/")
+_YOUTUBE_URL_PATTERN = re.compile(
+    r"(?:www\.)?(?:youtube\.com/(?:channel/|@|user/)[\w-]+|youtu\.be/[\w-]+)"
+)
+
 def validate_youtube_url(url: str) -> bool:
     """
     Validate YouTube channel/Video URL format
@@ -133,11 +211,30 @@ def validate_youtube_url(url: str) -> bool:
         >>> validate_youtube_url("https://youtube.com/@channel")
         True
     """
-    patterns = [
-        r"(https?://)?(www\.)?youtube\.com/(channel/|@|user/)[\w-]+",
-        r"(https?://)?(www\.)?youtu\.be/[\w-]+"
-    ]
-    return any(re.match(pattern, url) for pattern in patterns)
+    for scheme in _YOUTUBE_SCHEMES:
+        if url.startswith(scheme):
+            url = url[len(scheme):]
+            break
+    if not url.startswith(_YOUTUBE_HOSTS):
+        return False
+    return _YOUTUBE_URL_PATTERN.match(url) is not None
+
+@lru_cache(maxsize=1)
+def _today_year(hour_bucket: int) -> int:
+    """Year lookup memoized per hour bucket (see current_year)"""
+    return datetime.now().year
+
+def current_year() -> int:
+    """
+    Return the current calendar year
+    
+    The value is cached and refreshed at most once per hour, so bulk
+    validation and analysis don't hit the system clock per record.
+    
+    Returns:
+        Current year as an integer
+    """
+    return _today_year(int(time.time()) // 3600)
 
 def calculate_career_duration(start_year: int) -> int:
     """
@@ -153,8 +250,7 @@ def calculate_career_duration(start_year: int) -> int:
         >>> calculate_career_duration(2018)
         5
     """
-    current_year = datetime.now().year
-    return max(current_year - start_year, 0)
+    return max(current_year() - start_year, 0)
 
 def datetime_converter(obj):
     """